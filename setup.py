@@ -30,12 +30,21 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 # ==================================================================================
 
-from setuptools import setup, find_packages  # Always prefer setuptools over distutils
+from setuptools import setup, find_packages, Extension  # Always prefer setuptools over distutils
 from os import path
 import io
 
 here = path.abspath(path.dirname(__file__))
 
+# The C accelerator for the UBX parser is optional, it is only built if Cython is available.
+try:
+    from Cython.Build import cythonize
+except ImportError:
+    ext_modules = []
+else:
+    ext_modules = cythonize([Extension("ublox_gps._ublox_accel", ["ublox_gps/_ublox_accel.pyx"],
+                                       extra_compile_args=["-O3"])])
+
 # get the log description
 with io.open(path.join(here, "DESCRIPTION.rst"), encoding="utf-8") as f:
     long_description = f.read()
@@ -95,4 +104,8 @@ setup(
     # simple. Or you can use find_packages().
     packages=["ublox_gps"],
 
+    package_data={"ublox_gps": ["*.pyx"]},
+
+    ext_modules=ext_modules,
+
 )
@@ -0,0 +1,53 @@
+# cython: language_level=3
+"""Optional C accelerated helpers for the UBX parser.
+
+This module is only built when Cython is available, core falls back to the
+pure Python implementations when it cannot be imported.
+"""
+
+cimport cython
+from libc.string cimport memchr
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cpdef tuple fletcher8(const unsigned char[::1] buf):
+    """Return the two 8-bit Fletcher checksum bytes for the buffer
+
+    The sums are evaluated in closed form, A is the sum of the bytes and B
+    weights each byte by the number of bytes from it to the end. Unlike the
+    running form there is no dependency between iterations, so the compiler
+    can vectorise the loop. Overflow of the 32-bit sums is harmless as only
+    the low byte is kept.
+    """
+    cdef unsigned int sum_a = 0
+    cdef unsigned int sum_b = 0
+    cdef Py_ssize_t i
+    cdef Py_ssize_t n = buf.shape[0]
+
+    for i in range(n):
+        sum_a += buf[i]
+        sum_b += <unsigned int>(n - i) * buf[i]
+
+    return sum_a & 0xFF, sum_b & 0xFF
+
+cpdef Py_ssize_t find_preamble(const unsigned char[::1] buf, Py_ssize_t start):
+    """Return the index of the first 0xB5 0x62 preamble at or after start, or -1"""
+    cdef Py_ssize_t n = buf.shape[0]
+    cdef const unsigned char *p
+    cdef const unsigned char *hit
+    cdef Py_ssize_t i = start if start > 0 else 0
+
+    if n < 2:
+        return -1
+
+    p = &buf[0]
+    while i < n - 1:
+        hit = <const unsigned char *>memchr(p + i, 0xB5, n - 1 - i)
+        if hit == NULL:
+            return -1
+        i = hit - p
+        if p[i + 1] == 0x62:
+            return i
+        i += 1
+
+    return -1
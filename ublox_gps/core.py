@@ -1,44 +1,67 @@
 #This code is based on the work by daylomople (https://github.com/dalymople) and the awesome parsing capabilities of ubxtranslator (https://github.com/dalymople/ubxtranslator). 
-u"""The core structure definitions"""
+"""The core structure definitions"""
 
-from __future__ import absolute_import
 import struct
+import sys
 from collections import namedtuple
+from functools import lru_cache
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    from ._ublox_accel import fletcher8, find_preamble
+except ImportError:
+    fletcher8 = None
+    find_preamble = None
 #from typing import List, Iterator, Union
 
-__all__ = [u'PadByte', u'Field', u'Flag', u'BitField', u'RepeatedBlock', u'Message', u'Cls', u'Parser', ]
+__all__ = ['PadByte', 'Field', 'Flag', 'BitField', 'RepeatedBlock', 'Message', 'Cls', 'Parser', ]
+
+# class, id and little-endian payload length of a UBX frame
+_UBX_HEADER = struct.Struct('<BBH')
+
+# below this many bytes the NumPy call overhead costs more than the plain checksum loop
+_NUMPY_MIN_LEN = 48
+
+
+@lru_cache(maxsize=None)
+def _make_nt(name, fields):
+    """Return a named tuple class for the name and tuple of field names.
+
+    Creating a named tuple class is slow, so classes are shared between structures
+    with the same name and fields. The UBX protocol only has a limited number of
+    these so the cache is not bounded.
+    """
+    return namedtuple(name, fields)
 
 
 class PadByte(object):
-    u"""A padding byte, used for padding the messages.
+    """A padding byte, used for padding the messages.
 
     The number of repeats needs to be used carefully...
     If you want 6 total pad bytes, the pad byte is repeated 5 times.
 
     If this proves confusing it may be changed in the future.
     """
-    __slots__ = [u'repeat', ]
+    __slots__ = ['repeat', 'fmt', ]
+
+    # Pad bytes do not produce any values when unpacked
+    _count = 0
 
     def __init__(self, repeat = 0):
         self.repeat = repeat
+        self.fmt = 'x' * (self.repeat + 1)
 
     @property
     def repeated_block(self):
         return False
 
-    @property
-    def fmt(self):
-        u"""Return the format char for use with the struct package"""
-        return u'x' * (self.repeat + 1)
-
-    @staticmethod
-    def parse(_it):
-        u"""Discard the padding bytes"""
-        return None, None
-
 
 class Field(object):
-    u"""A field type that is used to describe most `normal` fields.
+    """A field type that is used to describe most `normal` fields.
 
     The descriptor code is as per the uBlox data sheet available;
     https://www.u-blox.com/sites/default/files/products/documents/u-blox8-M8_ReceiverDescrProtSpec_%28UBX-13003221%29_Public.pdf
@@ -47,60 +70,59 @@ class Field(object):
 
     In future that support may be added but it would probably use a different field constructor...
     """
-    __types__ = {u'U1': u'B', u'I1': u'b',
-                 u'U2': u'H', u'I2': u'h',
-                 u'U4': u'I', u'I4': u'i', u'R4': u'f',
-                 u'R8': u'd', u'C': u'c', u'S': u's'}
-    __slots__ = [u'name', u'_type', u'_len']
+    __types__ = {'U1': 'B', 'I1': 'b',
+                 'U2': 'H', 'I2': 'h',
+                 'U4': 'I', 'I4': 'i', 'R4': 'f',
+                 'R8': 'd', 'C': 'c', 'S': 's'}
+    __slots__ = ['name', '_type', '_len', 'fmt', '_count', 'parse_slice', ]
 
     def __init__(self, name, type_, len_ = 1):
-        self.name = name
+        self.name = sys.intern(name)
 
         if (len_ is None or len_ < 0):
-            ValueError(u'The provided _len is not valid')
+            ValueError('The provided _len is not valid')
 
 
         self._len = len_
 
         if type_ not in Field.__types__:
-            raise ValueError(u'The provided _type of {} is not valid'.format(type_))
-        self._type = type_
+            raise ValueError('The provided _type of {} is not valid'.format(type_))
+        self._type = sys.intern(type_)
+        self.fmt = (str(self._len) if self._len > 1 else '') + Field.__types__[self._type]
+
+        # A string is unpacked as a single value, whatever its length
+        self._count = 1 if self._type == 'S' else self._len
+
+        # struct already unpacks the numeric types as int or float, so the parse
+        # function is chosen once here rather than switching on the type each parse.
+        if self._type == 'S':
+            self.parse_slice = Field._parse_string
+        elif self._count == 1:
+            self.parse_slice = Field._parse_scalar
+        else:
+            self.parse_slice = self._parse_array
 
     @property
     def repeated_block(self):
         return False
 
-    @property
-    def fmt(self):
-        u"""Return the format char for use with the struct package"""
-
-        return (unicode(self._len) if self._len > 1 else u'') + Field.__types__[self._type]
-
-    def parse(self, it):
-        u"""Return a tuple representing the provided value/s"""
-        resp = []
-        len = 1 if self._type == u'S' else self._len
-
-        for i in xrange(0, len):
-            resp.append(it.next())
+    @staticmethod
+    def _parse_scalar(tup, start):
+        """Return the value found at the start index of the unpacked tuple"""
+        return tup[start]
 
-        if self._type in [u'U1', u'I1', u'U2', u'I2', u'U4', u'I4', ]:
-            for i in xrange(0, len):
-                resp[i] = int(resp[i])
-        elif self._type == u'R4':
-            for i in xrange(0, len):
-                resp[i] = float(resp[i])
-        elif self._type == u'R8':
-            for i in xrange(0, len):
-                resp[i] = double(resp[i])
-        elif self._type == u'S':
-            resp = [resp[0].decode(u'ascii').rstrip(u'\0')]
+    @staticmethod
+    def _parse_string(tup, start):
+        """Return the string found at the start index of the unpacked tuple"""
+        return tup[start].decode('ascii').rstrip('\0')
 
-        return self.name, resp[0] if len == 1 else resp
+    def _parse_array(self, tup, start):
+        """Return a tuple of the values found from the start index of the unpacked tuple"""
+        return tup[start:start + self._count]
 
 
 class Flag(object):
-    u"""A flag within a bit field.
+    """A flag within a bit field.
 
     The start and stop indexes are used in a similar way to list indexing.
     They are zero indexed and the stop is exclusive.
@@ -112,34 +134,32 @@ class Flag(object):
     strict checking is done within classes that use this. For example you can set a
     start and stop > 8 even if the bit field is only 8 bits wide.
     """
-    __slots__ = [u'name', u'_start', u'_stop', u'_mask', ]
+    __slots__ = ['name', '_start', '_stop', '_mask', ]
 
     def __init__(self, name, start, stop):
-        self.name = name
+        self.name = sys.intern(name)
 
         if 0 > start:
-            raise ValueError(u'The start index must be greater than 0 not {}'.format(start))
+            raise ValueError('The start index must be greater than 0 not {}'.format(start))
 
         if start > stop:
-            raise ValueError(u'The start index, {}, must be higher than the stop index, {}'.format(start, stop))
+            raise ValueError('The start index, {}, must be higher than the stop index, {}'.format(start, stop))
 
         if stop > 4 * 8:
-            raise ValueError(u'The stop index must be less than 4 bytes wide not {}'.format(stop))
+            raise ValueError('The stop index must be less than 4 bytes wide not {}'.format(stop))
 
         self._start = start
         self._stop = stop
 
-        self._mask = 0x00
-        for i in xrange(start, stop):
-            self._mask |= 0x01 << i
+        self._mask = ((1 << (stop - start)) - 1) << start
 
     def parse(self, value):
-        u"""Return a tuple representing the provided value"""
+        """Return a tuple representing the provided value"""
         return self.name, (value & self._mask) >> self._start
 
 
 class BitField(object):
-    u"""A bit field type made up of flags.
+    """A bit field type made up of flags.
 
     The bit field uses the types described within the uBlox data sheet:
     https://www.u-blox.com/sites/default/files/products/documents/u-blox8-M8_ReceiverDescrProtSpec_%28UBX-13003221%29_Public.pdf
@@ -151,60 +171,72 @@ class BitField(object):
 
     """
 
-    __slots__ = [u'name', u'_type', u'_subfields', u'_nt', ]
-    __types__ = {u'X1': u'B', u'X2': u'H', u'X4': u'I'}
+    __slots__ = ['name', '_type', '_subfields', '_nt', 'fmt', '_mask_shift', ]
+    __types__ = {'X1': 'B', 'X2': 'H', 'X4': 'I'}
+
+    # The whole bit field is unpacked as a single integer
+    _count = 1
 
     # noinspection PyProtectedMember
     def __init__(self, name, type_, subfields):
-        self.name = name
+        self.name = sys.intern(name)
 
         if type_ not in BitField.__types__:
-            raise ValueError(u'The provided _type of {} is not valid'.format(type_))
-        self._type = type_
+            raise ValueError('The provided _type of {} is not valid'.format(type_))
+        self._type = sys.intern(type_)
+        self.fmt = BitField.__types__[type_]
 
         self._subfields = subfields
 
-        if type_ == u'X1':
+        if type_ == 'X1':
             width = 1
-        elif type_ == u'X2':
+        elif type_ == 'X2':
             width = 2
         else:
             width = 4
 
         for sf in subfields:
             if sf._stop > (width * 8):
-                raise ValueError(u'{} stop index of {} is wider than the implicit width of {} bytes'.format(
+                raise ValueError('{} stop index of {} is wider than the implicit width of {} bytes'.format(
                     sf.__class__.__name__, sf._stop, width
                 ))
 
-        self._nt = namedtuple(self.name, [f.name for f in self._subfields])
+        self._nt = _make_nt(self.name, tuple([f.name for f in self._subfields]))
+
+        # The flags are only needed for their mask and shift when parsing
+        self._mask_shift = tuple([(sf._mask, sf._start) for sf in subfields])
 
     @property
     def repeated_block(self):
         return False
 
-    @property
-    def fmt(self):
-        u"""Return the format char for use with the struct package"""
-        return BitField.__types__[self._type]
-
-    def parse(self, it):
-        u"""Return a named tuple representing the provided value"""
-        value = it.next()
-        return self.name, self._nt(**dict((k, v) for k, v in [x.parse(value) for x in self._subfields]))
+    def parse_slice(self, tup, start):
+        """Return a named tuple representing the value at the start index of the unpacked tuple"""
+        value = tup[start]
+        return self._nt._make([(value & mask) >> shift for mask, shift in self._mask_shift])
 
 
 class RepeatedBlock(object):
-    u"""Defines a repeated block of Fields within a UBX Message
+    """Defines a repeated block of Fields within a UBX Message
 
     """
-    __slots__ = [u'name', u'_fields', u'repeat', u'_nt', ]
+    __slots__ = ['name', '_fields', 'repeat', '_nt', '_plan', '_count', '_base_rep_fmt', ]
 
     def __init__(self, name, fields):
-        self.name = name
+        self.name = sys.intern(name)
         self._fields = fields
         self.repeat = 0
-        self._nt = namedtuple(self.name, [f.name for f in self._fields if hasattr(f, u'name')])
+        self._base_rep_fmt = ''.join([field.fmt for field in self._fields])
+
+        # Offsets of the named fields within a single repetition of the block
+        self._plan = []
+        self._count = 0
+        for field in self._fields:
+            if hasattr(field, 'name'):
+                self._plan.append((field, self._count))
+            self._count += field._count
+
+        self._nt = _make_nt(self.name, tuple([f.name for f, _ in self._plan]))
 
     @property
     def repeated_block(self):
@@ -212,20 +244,24 @@ class RepeatedBlock(object):
 
     @property
     def fmt(self):
-        u"""Return the format string for use with the struct package."""
-        return u''.join([field.fmt for field in self._fields]) * (self.repeat + 1)
+        """Return the format string for use with the struct package."""
+        return self._base_rep_fmt * (self.repeat + 1)
 
-    def parse(self, it):
-        u"""Return a tuple representing the provided value/s"""
+    def parse_slice(self, tup, start, repeat):
+        """Return a list of named tuples for the repeated values from the start index of the unpacked tuple.
+        repeat is one less than the number of blocks in the payload, it is passed in rather than read from
+        self.repeat as the message definitions are shared between threads.
+        """
         resp = []
-        for i in xrange(self.repeat + 1):
-            resp.append(self._nt(**dict((k, v) for k, v in [f.parse(it) for f in self._fields] if k is not None)))
+        for i in range(repeat + 1):
+            offset = start + i * self._count
+            resp.append(self._nt._make([f.parse_slice(tup, offset + off) for f, off in self._plan]))
 
-        return self.name, resp
+        return resp
 
 
 class Message(object):
-    u"""Defines a UBX message.
+    """Defines a UBX message.
 
     The Messages are described in the data sheet:
     https://www.u-blox.com/sites/default/files/products/documents/u-blox8-M8_ReceiverDescrProtSpec_%28UBX-13003221%29_Public.pdf
@@ -240,74 +276,145 @@ class Message(object):
     will raise a ValueError
 
     """
-    __slots__ = [u'_id', u'name', u'_fields', u'_nt', u'_repeated_block', ]
+    __slots__ = ['_id', 'name', '_fields', '_nt', '_plan', '_tail_plan', '_repeated_block', '_block_offset',
+                 '_head_fmt', '_tail_fmt', '_base_fmt', '_rep_fmt', '_base_size', '_rep_size',
+                 '_struct_cache', ]
 
     def __init__(self, id_, name, fields):
         if id_ < 0:
-            raise ValueError(u'The _id must be >= 0, not {}'.format(id_))
+            raise ValueError('The _id must be >= 0, not {}'.format(id_))
 
         if id_ > 0xFF:
-            raise ValueError(u'The _id must be <= 0xFF, not {}'.format(id_))
+            raise ValueError('The _id must be <= 0xFF, not {}'.format(id_))
 
         self._id = id_
-        self.name = name
+        self.name = sys.intern(name)
         self._fields = fields
-        self._nt = namedtuple(self.name, [f.name for f in self._fields if hasattr(f, u'name')])
         self._repeated_block = None
 
+        # Each named field is given its offset into the unpacked tuple. Pad bytes have no
+        # name and consume no unpacked values so they are left out. The offsets of fields
+        # following the repeated block assume a single repetition and are shifted when parsing.
+        # The repeated block itself is parsed separately from its own offset.
+        self._plan = []
+        self._tail_plan = []
+        self._block_offset = 0
+        names = []
+        offset = 0
         for field in fields:
             if field.repeated_block:
                 if self._repeated_block is not None:
-                    raise ValueError(u'Cannot assign multiple repeated blocks to a message.')
+                    raise ValueError('Cannot assign multiple repeated blocks to a message.')
                 self._repeated_block = field
+                self._block_offset = offset
+            elif hasattr(field, 'name'):
+                if self._repeated_block is not None:
+                    self._tail_plan.append((field, offset))
+                else:
+                    self._plan.append((field, offset))
+
+            if hasattr(field, 'name'):
+                names.append(field.name)
+            offset += field._count
+
+        self._nt = _make_nt(self.name, tuple(names))
+
+        # The struct format only changes with the number of repeated blocks, so the
+        # compiled structs are cached by the repeat count.
+        self._head_fmt = ''
+        self._tail_fmt = ''
+        in_tail = False
+        for field in fields:
+            if field.repeated_block:
+                in_tail = True
+            elif in_tail:
+                self._tail_fmt += field.fmt
+            else:
+                self._head_fmt += field.fmt
+        self._base_fmt = self._head_fmt + self._tail_fmt
+        self._base_size = struct.calcsize('<' + self._base_fmt)
+
+        if self._repeated_block is not None:
+            # noinspection PyProtectedMember
+            self._rep_fmt = self._repeated_block._base_rep_fmt
+        else:
+            self._rep_fmt = ''
+        self._rep_size = struct.calcsize('<' + self._rep_fmt)
+
+        if self._repeated_block is not None and self._rep_size == 0:
+            raise ValueError('A repeated block must have a non zero length.')
+
+        self._struct_cache = {}
 
     @property
     def id_(self):
-        u"""Public read only access to the message id"""
+        """Public read only access to the message id"""
         return self._id
 
     @property
     def fmt(self):
-        u"""Return the format string for use with the struct package."""
-        return u''.join([field.fmt for field in self._fields])
+        """Return the format string for use with the struct package."""
+        if self._repeated_block is None:
+            return self._base_fmt
+
+        return self._head_fmt + self._repeated_block.fmt + self._tail_fmt
+
+    def _valid_length(self, payload_len):
+        """Return True if a payload of the provided length could be parsed as this message"""
+        if self._repeated_block is None:
+            return payload_len == self._base_size
+
+        delta = payload_len - self._base_size
+        return delta >= 0 and delta % self._rep_size == 0
 
     def parse(self, payload):
-        u"""Return a named tuple parsed from the provided payload.
+        """Return a named tuple parsed from the provided payload.
 
         If the provided payload is not the same length as what is implied by the format string
         then a ValueError is raised.
+
+        The number of repeated blocks is worked out from the payload length, a message may
+        contain zero repeated blocks.
         """
 
         payload_len = len(payload)
 
+        if self._repeated_block is None:
+            if payload_len != self._base_size:
+                raise ValueError('The payload length does not match the length implied by the message fields. ' +
+                                 'Expected {} actual {}'.format(self._base_size, payload_len))
+            repeat = 0
+        else:
+            delta = payload_len - self._base_size
+            if delta < 0 or delta % self._rep_size != 0:
+                raise ValueError('The payload length does not match the length implied by the message fields. ' +
+                                 'Expected {} + n * {} actual {}'.format(self._base_size, self._rep_size,
+                                                                          payload_len))
+            # The repeat count is one less than the number of blocks
+            repeat = delta // self._rep_size - 1
+
+        # Nothing shared is written here, the message definitions are used by every reader thread.
         try:
-            self._repeated_block.repeat = 0
-        except AttributeError:
-            pass
-
-        while True:
-            fmt_len = struct.calcsize(self.fmt)
-
-            if fmt_len == payload_len:
-                break
+            msg_struct = self._struct_cache[repeat]
+        except KeyError:
+            msg_struct = self._struct_cache[repeat] = struct.Struct(
+                '<' + self._head_fmt + self._rep_fmt * (repeat + 1) + self._tail_fmt)
 
-            if fmt_len > payload_len:
-                raise ValueError(u'The payload length does not match the length implied by the message fields. ' +
-                                 u'Expected {} actual {}'.format(struct.calcsize(self.fmt), len(payload)))
+        tup = msg_struct.unpack(payload)
+        values = [f.parse_slice(tup, off) for f, off in self._plan]
 
-            try:
-                self._repeated_block.repeat += 1
-            except AttributeError:
-                raise ValueError(u'The payload length does not match the length implied by the message fields. ' +
-                                 u'Expected {} actual {}'.format(struct.calcsize(self.fmt), len(payload)))
+        if self._repeated_block is not None:
+            values.append(self._repeated_block.parse_slice(tup, self._block_offset, repeat))
 
-        it = iter(struct.unpack(self.fmt, payload))
+            if self._tail_plan:
+                shift = repeat * self._repeated_block._count
+                values.extend([f.parse_slice(tup, off + shift) for f, off in self._tail_plan])
 
-        return self.name, self._nt(**dict((k, v) for k, v in [f.parse(it) for f in self._fields] if k is not None))
+        return self.name, self._nt._make(values)
 
 
 class Cls(object):
-    u"""Defines a UBX message class.
+    """Defines a UBX message class.
 
     The Classes are described in the data sheet:
     https://www.u-blox.com/sites/default/files/products/documents/u-blox8-M8_ReceiverDescrProtSpec_%28UBX-13003221%29_Public.pdf
@@ -316,18 +423,18 @@ class Cls(object):
 
     The id_ should not be modified after registering the class with the parser.
     """
-    __slots__ = [u'_id', u'name', u'_messages', ]
+    __slots__ = ['_id', 'name', '_messages', ]
 
     def __init__(self, id_, name, messages):
         if id_ < 0:
-            raise ValueError(u'The _id must be >= 0, not {}'.format(id_))
+            raise ValueError('The _id must be >= 0, not {}'.format(id_))
 
         if id_ > 0xFF:
-            raise ValueError(u'The _id must be <= 0xFF, not {}'.format(id_))
+            raise ValueError('The _id must be <= 0xFF, not {}'.format(id_))
 
         self._id = id_
 
-        self.name = name
+        self.name = sys.intern(name)
 
         self._messages = {}
         for msg in messages:
@@ -335,7 +442,7 @@ class Cls(object):
 
     @property
     def id_(self):
-        u"""Public read only access to the class id"""
+        """Public read only access to the class id"""
         return self._id
 
     def __contains__(self, item):
@@ -345,17 +452,17 @@ class Cls(object):
         try:
             return self._messages[item]
         except KeyError:
-            raise KeyError(u"A message of id {} has not been registered within {!r}".format(
+            raise KeyError("A message of id {} has not been registered within {!r}".format(
                 item, self
             ))
 
     def register_msg(self, msg):
-        u"""Register a message type."""
+        """Register a message type."""
         # noinspection PyProtectedMember
         self._messages[msg._id] = msg
 
     def parse(self, msg_id, payload):
-        u"""Return a named tuple parsed from the provided payload.
+        """Return a named tuple parsed from the provided payload.
 
         If the provided payload is not the same length as what is implied by the format string
         then a ValueError is raised.
@@ -366,7 +473,7 @@ class Cls(object):
 
 
 class Parser(object):
-    u"""A lightweight UBX message parser.
+    """A lightweight UBX message parser.
 
     This class is designed to contain a set of message classes, when a stream is passed via the `receive_from`
     method the stream is read until the PREFIX is found, the message type is matched to the registered class
@@ -374,7 +481,8 @@ class Parser(object):
     as a named tuple.
 
     This is powered by the inbuilt struct package for the heavy lifting of the message decoding and there are
-    no external dependencies.
+    no external dependencies. If the optional _ublox_accel extension was built it is used for the checksum and
+    the PREFIX search, otherwise if NumPy is installed it is used to speed up the checksum of longer messages.
 
     Message classes can be passed via the constructor or the `register_cls` method.
 
@@ -382,104 +490,194 @@ class Parser(object):
     supports a `read` method and returns bytes. It is up to the implementation to determine how to get the
     UBX packets from the device. The typical way to do this would be a serial package like pyserial, see the
     examples file.
+
+    While searching for the PREFIX the stream is read in chunks of whatever is waiting, up to SCAN_CHUNK bytes.
+    Any bytes read past the PREFIX are kept by the parser and used before reading from the stream again.
     """
-    PREFIX = str((0xB5, 0x62))
+    PREFIX = b'\xb5\x62'
+    SCAN_CHUNK = 256
 
     def __init__(self, classes):
-        self._input_buffer = ''
+        self._scan_buf = bytearray()
 
         self.classes = {}
         for cls in classes:
             self.classes[cls._id] = cls
 
     def register_cls(self, cls):
-        u"""Register a message  class."""
+        """Register a message  class."""
         self.classes[cls.id_] = cls
 
 
     def receive_from(self, stream, skippreamble = False, ignoreunsupported = False):
-        u"""Receive a message from a stream and return as a namedtuple.
+        """Receive a message from a stream and return as a namedtuple.
         raise IOError or ValueError on errors.
         """
-        while not(skippreamble):
-            # Search for the prefix
-            buff = self._read_until(stream, terminator=self.PREFIX)
-            if buff[-2:] == self.PREFIX:
-                break
+        ubx_cls, msg, frame = self.receive_frame(stream, skippreamble, ignoreunsupported)
+        if msg is None:
+            return (None, None, None)
+
+        name, nt = msg.parse(frame[4:])
+        return ubx_cls.name, name, nt
+
+    def receive_frame(self, stream, skippreamble = False, ignoreunsupported = False):
+        """Receive a message from a stream without parsing it.
+        Return the message class, the message and a memoryview of the frame from the class id to the end of
+        the payload, the checksum has already been checked. raise IOError or ValueError on errors.
+        """
+        if not(skippreamble):
+            self._sync_to_preamble(stream)
 
         # read the first four bytes
-        buff = stream.read(4)
+        header = self._read(stream, 4)
 
 
-        if len(buff) != 4:
-            raise IOError(u"A stream read returned {} bytes, expected 4 bytes".format(len(buff)))
+        if len(header) != 4:
+            raise IOError("A stream read returned {} bytes, expected 4 bytes".format(len(header)))
 
         # convert them into the packet descriptors
-        msg_cls, msg_id, length = struct.unpack(u'BBH', buff)
+        msg_cls, msg_id, length = _UBX_HEADER.unpack_from(header, 0)
 
         # check the packet validity
-        if msg_cls not in self.classes:
+        ubx_cls = self.classes.get(msg_cls)
+        if ubx_cls is None:
             if ignoreunsupported:
                 return (None, None, None)
             else:
-                raise ValueError(u"Received message id of {:x} in unsupported class {:x}".format(msg_id, msg_cls))
+                raise ValueError("Received message id of {:x} in unsupported class {:x}".format(msg_id, msg_cls))
 
-        if msg_id not in self.classes[msg_cls]:
+        # noinspection PyProtectedMember
+        msg = ubx_cls._messages.get(msg_id)
+        if msg is None:
             if ignoreunsupported:
                 return (None, None, None)
             else:
-                raise ValueError(u"Received unsupported message id of {:x} in class {:x}".format(msg_id, msg_cls))
+                raise ValueError("Received unsupported message id of {:x} in class {:x}".format(msg_id, msg_cls))
 
-        # Read the payload
-        buff += stream.read(length)
-        if len(buff) != (4 + length):
-            raise IOError(u"A stream read returned {} bytes, expected {} bytes".format(
-                len(buff), 4 + length))
+        # reject a length the message could never have before reading the payload, this is
+        # a corrupt frame rather than an unsupported message so it is always an error
+        # noinspection PyProtectedMember
+        if not msg._valid_length(length):
+            raise ValueError("Received message id of {:x} in class {:x} with invalid length {}".format(
+                msg_id, msg_cls, length))
+
+        # Read the payload straight into the frame buffer, the checksum and the parsing
+        # both work on views of it so the payload is not copied again.
+        buff = bytearray(4 + length)
+        buff[:4] = header
+        view = memoryview(buff)
+        read_len = self._read_into(stream, view[4:])
+        if read_len != length:
+            raise IOError("A stream read returned {} bytes, expected {} bytes".format(
+                4 + read_len, 4 + length))
 
         # Read the checksum
-        checksum_sup = stream.read(2)
+        checksum_sup = self._read(stream, 2)
         if len(checksum_sup) != 2:
-            raise IOError(u"A stream read returned {} bytes, expected 2 bytes".format(len(buff)))
+            raise IOError("A stream read returned {} bytes, expected 2 bytes".format(len(checksum_sup)))
 
-        checksum_cal = self._generate_fletcher_checksum(buff)
+        checksum_cal = self._generate_fletcher_checksum(view)
         if checksum_cal != checksum_sup:
-            raise ValueError(u"Checksum mismatch. Calculated {:x} {:x}, received {:x} {:x}".format(
+            raise ValueError("Checksum mismatch. Calculated {:x} {:x}, received {:x} {:x}".format(
                 checksum_cal[0], checksum_cal[1], checksum_sup[0], checksum_sup[1]
             ))
 
-        return self.classes[msg_cls].parse(msg_id, buff[4:])
+        return ubx_cls, msg, view
 
-    @staticmethod
-    def _read_until(stream, terminator, size=None):
-        u"""Read from the stream until the terminator byte/s are read.
-        Return the bytes read including the termination bytes.
+    def parse_frame(self, frame):
+        """Parse a frame as returned by `receive_frame` and return as `receive_from` does."""
+        msg_cls, msg_id, length = _UBX_HEADER.unpack_from(frame, 0)
+        ubx_cls = self.classes[msg_cls]
+        # noinspection PyProtectedMember
+        name, nt = ubx_cls._messages[msg_id].parse(memoryview(frame)[4:])
+        return ubx_cls.name, name, nt
+
+    def _sync_to_preamble(self, stream):
+        """Read from the stream in chunks until the PREFIX is found.
+        The bytes following the PREFIX are kept for the next reads.
         """
-        term_len = len(terminator)
-        line = bytearray()
+        buf = self._scan_buf
+        keep = len(self.PREFIX) - 1
         while True:
-            c = stream.read(1)
-            if c:
-                line += c
-                if line[-term_len:] == terminator:
-                    break
-                if size is not None and len(line) >= size:
-                    break
+            if find_preamble is not None:
+                idx = find_preamble(buf, 0)
+            else:
+                idx = buf.find(self.PREFIX)
+            if idx >= 0:
+                del buf[:idx + len(self.PREFIX)]
+                return
+
+            # Nothing before the last byte can start a PREFIX, so the scanned bytes are dropped
+            # rather than searched again. The last byte is kept in case the PREFIX is split
+            # across two reads.
+            if len(buf) > keep:
+                del buf[:len(buf) - keep]
+
+            # Only ask for what has already arrived, a blocking read of a full chunk
+            # would wait for the timeout, or forever without one, after a short message.
+            buf += stream.read(min(getattr(stream, 'in_waiting', 0) or 1, self.SCAN_CHUNK))
+
+    def _read(self, stream, size):
+        """Read size bytes, using any bytes left over from the PREFIX search first."""
+        buf = self._scan_buf
+        if not buf:
+            return stream.read(size)
+
+        data = bytes(buf[:size])
+        del buf[:size]
+        if len(data) < size:
+            data += stream.read(size - len(data))
+
+        return data
+
+    def _read_into(self, stream, view):
+        """Fill the view, using any bytes left over from the PREFIX search first.
+        Return the number of bytes read.
+        """
+        size = len(view)
+        buf = self._scan_buf
+        n = min(len(buf), size)
+        if n:
+            view[:n] = buf[:n]
+            del buf[:n]
+
+        if n < size:
+            if hasattr(stream, 'readinto'):
+                n += stream.readinto(view[n:]) or 0
             else:
-                break
+                data = stream.read(size - n)
+                view[n:n + len(data)] = data
+                n += len(data)
 
-        return str(line)
+        return n
 
     @staticmethod
     def _generate_fletcher_checksum(payload):
-        u"""Return the checksum for the provided payload"""
-        check_a = 0
-        check_b = 0
+        """Return the checksum for the provided payload
 
-        for char in payload:
-            check_a += ord(char)
-            check_a &= 0xFF
+        With NumPy the running sums of the 8-bit Fletcher algorithm are evaluated in closed form;
+        A is the sum of the bytes and B weights each byte by the number of times it is
+        added into A, which is the number of bytes from it to the end of the payload.
+        """
+        if fletcher8 is not None:
+            return bytes(fletcher8(payload))
+
+        n = len(payload)
 
-            check_b += check_a
+        if np is not None and n >= _NUMPY_MIN_LEN:
+            arr = np.frombuffer(payload, dtype=np.uint8).astype(np.uint32)
+            # uint32 overflow is harmless as only the low byte is kept
+            check_a = int(arr.sum()) & 0xFF
+            check_b = int(np.arange(n, 0, -1, dtype=np.uint32).dot(arr)) & 0xFF
+        else:
+            # in pure Python the running sums beat the closed form, the masks are
+            # applied once at the end
+            check_a = 0
+            check_b = 0
+            for char in payload:
+                check_a += char
+                check_b += check_a
+            check_a &= 0xFF
             check_b &= 0xFF
 
-        return str((check_a, check_b))
+        return bytes((check_a, check_b))
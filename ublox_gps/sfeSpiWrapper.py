@@ -30,11 +30,12 @@
 # pylint: disable=line-too-long, bad-whitespace, invalid-name, too-many-public-methods
 #
 
-from __future__ import absolute_import
+import time
+
 import spidev
 
 class sfeSpiWrapper(object):
-    u"""
+    """
     sfeSpiWrapper
 
     Initialize the library with the given port.
@@ -47,6 +48,9 @@ class sfeSpiWrapper(object):
     :return:            The sfeSpiWrapper object.
     :rtype:             Object
     """
+    # The module clocks out 0xFF when it has nothing to send
+    IDLE_BYTE = 0xFF
+    IDLE_WAIT = 0.01 #seconds
 
     def __init__(self, spi_port = None):
 
@@ -57,10 +61,10 @@ class sfeSpiWrapper(object):
 
         self.spi_port.open(0,0)
         self.spi_port.max_speed_hz = 5500 #Hz
-        self.spi_port.mode = __builtins__.long("00", 2)
+        self.spi_port.mode = int("00", 2)
 
     def read(self, read_data = 1):
-        u"""
+        """
         Reads a byte or bytes of data from the SPI port. The bytes are
         converted to a bytes object before being returned.
 
@@ -68,14 +72,26 @@ class sfeSpiWrapper(object):
         :rtype: bytes
         """
 
-        data = self.spi_port.readbytes(read_data)
-        byte_data = str([])
-        for d in data:
-            byte_data = byte_data + str([d])
-        return byte_data
+        return bytes(self.spi_port.readbytes(read_data))
+
+    def idle_poll(self, read_data = 1):
+        """
+        Reads like read() while searching for the start of a message. If the
+        module had no data to send the read waits briefly before returning,
+        so callers scanning in a loop do not spin on the bus. Reads inside a
+        message should use read(), where 0xFF is a valid data byte.
+
+        :return: The requested bytes
+        :rtype: bytes
+        """
+
+        data = self.read(read_data)
+        if data.count(self.IDLE_BYTE) == len(data):
+            time.sleep(self.IDLE_WAIT)
+        return data
 
     def write(self, data):
-        u"""
+        """
         Writes a byte or bytes of data to the SPI port.
 
         :return: True on completion
@@ -43,36 +43,261 @@
 # pylint: disable=line-too-long, bad-whitespace, invalid-name, too-many-public-methods
 #
 
-from __future__ import division
-from __future__ import absolute_import
 import struct
 import serial
 import spidev
 
 import threading
+import multiprocessing
 import time
 
 import collections
 
-import sys
 import traceback
 
 from . import sfeSpiWrapper
 from . import sparkfun_predefines as sp
 from . import core
 
-_DEFAULT_NAME = u"Qwiic GPS"
+_DEFAULT_NAME = "Qwiic GPS"
 _AVAILABLE_I2C_ADDRESS = [0x42]
 
+# sync chars, class id, message id and little-endian payload length of a UBX frame
+_UBX_HDR = struct.Struct('<BBBBH')
+# version, layer, two reserved bytes and the little-endian key id of a CFG-VALGET/VALSET
+_CFG_VAL_HDR = struct.Struct('<BBBBI')
+# unsigned struct codes for the value sizes held in bits 28-30 of a configuration key id,
+# a one bit value is sent as a whole byte
+_CFG_VAL_FMT = {1: 'B', 2: 'B', 3: 'H', 4: 'I', 5: 'Q'}
+# the empty payload of a poll request
+_POLL = b''
+
+# scale factors applied by scale_packet() to the raw integer fields of the same name
+_PCKT_SCL = {
+    'lon' : 1e-7,
+    'lat' :  1e-7,
+    'headMot' :  1e-5,
+    'headAcc' :  1e-5,
+
+    'pDOP' :  0.01,
+    'gDOP' : 0.01,
+    'tDOP' : 0.01,
+    'vDOP' : 0.01,
+    'hDOP' : 0.01,
+    'nDOP' : 0.01,
+    'eDOP' : 0.01,
+
+    'headVeh' : 1e-5,
+    'magDec' : 1e-2,
+    'magAcc' : 1e-2,
+
+    'lonHp' : 1e-9,
+    'latHp' : 1e-9,
+    'heightHp' : 0.1,
+    'hMSLHp' : 0.1,
+    'hAcc' : 0.1,
+    'vAcc' : 0.1,
+
+    'errEllipseOrient': 1e-2,
+
+    'ecefX' : 0.1,
+    'ecefY' : 0.1,
+    'ecefZ' : 0.1,
+    'pAcc' : 0.1,
+
+    'prRes' : 0.1,
+
+    'cAcc' : 1e-5,
+    'heading' : 1e-5,
+
+    'relPosHeading' : 1e-5,
+    'relPosHPN' : 0.1,
+    'relPosHPE' : 0.1,
+    'relPosHPD' : 0.1,
+    'relPosHPLength' : 0.1,
+    'accN' : 0.1,
+    'accE' : 0.1,
+    'accD' : 0.1,
+    'accLength' : 0.1,
+    'accPitch' : 1e-5,
+    'accHeading' : 1e-5,
+
+    'roll' : 1e-5,
+    'pitch' : 1e-5,
+}
+_PCKT_SCL_KEYS = frozenset(_PCKT_SCL)
+
+# longest NMEA line kept waiting for its line ending, u-blox proprietary
+# sentences can be longer than the 82 characters of the standard
+_NMEA_MAX_LEN = 256
+
+def _payload_bytes(ubx_payload):
+    """
+    Converts a payload to the bytes sent on the wire. A list is taken as
+    byte values, a str as latin-1 characters and a single int as one byte.
+    """
+    if ubx_payload is None:
+        return _POLL
+    elif isinstance(ubx_payload, (bytes, bytearray, list)):
+        return bytes(ubx_payload)
+    elif isinstance(ubx_payload, str):
+        return ubx_payload.encode('latin-1')
+    else:
+        return bytes((ubx_payload,))
+
+def _cfg_val_bytes(key_id, value):
+    """
+    Converts a configuration value to the bytes sent in a CFG-VALSET. An int
+    or float is packed little-endian to the size given by the key id, a
+    negative int as signed, anything else is converted by _payload_bytes().
+    """
+    if not isinstance(value, (int, float)):
+        return _payload_bytes(value)
+
+    size = (key_id >> 28) & 0x07
+    fmt = _CFG_VAL_FMT.get(size)
+    if fmt is None:
+        raise ValueError("Key id {:#010x} has an unknown value size {}".format(key_id, size))
+
+    if isinstance(value, float):
+        if size == 4:
+            fmt = 'f'
+        elif size == 5:
+            fmt = 'd'
+        else:
+            raise ValueError("Key id {:#010x} does not hold a float value".format(key_id))
+    elif value < 0:
+        fmt = fmt.lower()
+
+    try:
+        return struct.pack('<' + fmt, value)
+    except struct.error:
+        raise ValueError("Value {} does not fit the {} byte(s) of key id {:#010x}".format(
+            value, struct.calcsize(fmt), key_id))
+
+def _read_port(port, parser, on_frame, on_nmea, on_error, stopping):
+    """
+    Reads UBX frames and NMEA lines from the port until stopping() returns
+    True. Checked frames are passed to on_frame(ubx_cls, msg, frame), NMEA
+    lines to on_nmea(line) and any error reading the port to on_error().
+    Malformed frames and lines are skipped.
+    This is the loop run by both the reader thread and the reader process.
+    """
+    # bound once, the loop runs for every message received
+    rx_buf = parser._scan_buf
+    find = rx_buf.find
+    read = port.read
+    # a port may back off in reads that find nothing to scan, see sfeSpiWrapper.idle_poll()
+    scan_read = getattr(port, 'idle_poll', read)
+    receive_frame = parser.receive_frame
+    PREFIX = core.Parser.PREFIX
+    PREFIX_LEN = len(PREFIX)
+
+    while True:
+        try:
+            if (stopping()):
+                break
+
+            idx_ubx = find(PREFIX)
+            idx_nmea = find(b'$')
+
+            if idx_ubx < 0 and idx_nmea < 0:
+                # keep the last byte in case it is the first half of the PREFIX
+                del rx_buf[:-1]
+                rx_buf += scan_read(getattr(port, 'in_waiting', 0) or 1)
+            elif idx_nmea >= 0 and (idx_ubx < 0 or idx_nmea < idx_ubx):
+                # NMEA is ASCII, so the line must end before any following PREFIX
+                idx_end = find(b'\x0d\x0a', idx_nmea, idx_ubx if idx_ubx >= 0 else len(rx_buf))
+                if idx_end < 0:
+                    if idx_ubx >= 0 or len(rx_buf) - idx_nmea > _NMEA_MAX_LEN:
+                        del rx_buf[:idx_nmea + 1] # not a complete NMEA line
+                    else:
+                        rx_buf += read(getattr(port, 'in_waiting', 0) or 1)
+                    continue
+
+                nmea_data = rx_buf[idx_nmea:idx_end]
+                del rx_buf[:idx_end + 2]
+                try:
+                    nmea_line = nmea_data.decode('utf-8').rstrip(' \r\n')
+                except UnicodeDecodeError:
+                    continue #we just ignore bad messages, we don't ignore communication issues though
+
+                on_nmea(nmea_line)
+            else:
+                del rx_buf[:idx_ubx + PREFIX_LEN]
+                try:
+                    ubx_cls, msg, frame = receive_frame(port, True, True)
+                except ValueError:
+                    continue # bad length or checksum, search for the next PREFIX
+
+                if msg is not None:
+                    on_frame(ubx_cls, msg, frame)
+
+        except Exception as e:
+            # the traceback is dropped, holding it would keep the reader's frames alive
+            on_error(e.with_traceback(None))
+
+            if (stopping()):
+                break
+
+def _reader_main(port_spec, packet_queue, nmea_queue, stop_event):
+    """
+    Entry point of the reader process used by backend='process'. Opens its
+    own serial port from the (port name, get_settings()) spec and sends
+    checked frames, as bytes, and any errors to packet_queue and NMEA lines
+    to nmea_queue. Parsing is left to the main process because the message
+    namedtuples can't be pickled.
+    """
+    port_name, settings = port_spec
+    try:
+        port = serial.Serial(port_name, **settings)
+    except Exception as e:
+        packet_queue.put(e.with_traceback(None))
+        return
+
+    parser = core.Parser([v for v in vars(sp).values() if isinstance(v, core.Cls)])
+
+    try:
+        _read_port(port, parser,
+                   lambda ubx_cls, msg, frame: packet_queue.put(bytes(frame)),
+                   nmea_queue.put,
+                   packet_queue.put,
+                   stop_event.is_set)
+    finally:
+        port.close()
+
+def _make_poll(name, cls_name, msg_name):
+    """
+    Returns a UbloxGps method that polls for a single message.
+    """
+    def poll(self, wait_time = 2500):
+        return self.request_standard_packet(cls_name, msg_name, wait_time = wait_time)
+
+    poll.__name__ = name
+    poll.__qualname__ = 'UbloxGps.' + name
+    poll.__doc__ = """
+        Sends a poll request for the {} class and the {} Message.
+        The response is then passed on to the user.
+
+        :return: ublox payload
+        :rtype: namedtuple
+        """.format(cls_name, msg_name)
+    return poll
+
 class UbloxGps(object):
-    u"""
+    """
     UbloxGps
 
     Initialize the library with the given port.
 
     :param hard_port:   The port to use to communicate with the module, this
                         can be a serial or SPI port. If no port is given, then the library
-                        assumes serial at a 38400 baud rate.
+                        assumes serial at a 38400 baud rate. The reader thread relies on
+                        the port's read blocking (e.g. a serial timeout) to pace itself.
+    :param backend:     'thread' (default) reads the port in a thread of this
+                        process. 'process' reads it in a separate process so
+                        the reader doesn't compete with the caller for the GIL,
+                        only serial ports are supported in this mode.
 
     :return:            The UbloxGps object.
     :rtype:             Object
@@ -85,11 +310,11 @@ class UbloxGps(object):
     device_name = _DEFAULT_NAME
     available_addresses = _AVAILABLE_I2C_ADDRESS
 
-    def __init__(self, hard_port = None):
+    def __init__(self, hard_port = None, backend = 'thread'):
         if hard_port is None:
-            self.hard_port = serial.Serial(u"/dev/serial0/", 38400, timeout=1)
+            self.hard_port = serial.Serial("/dev/serial0/", 38400, timeout=1)
         elif type(hard_port) == spidev.SpiDev:
-            sfeSpi = sfeSpiWrapper(hard_port)
+            sfeSpi = sfeSpiWrapper.sfeSpiWrapper(hard_port)
             self.hard_port = sfeSpi
         else:
             self.hard_port = hard_port
@@ -97,63 +322,19 @@ class UbloxGps(object):
         self.nmea_line_buffer = collections.deque(maxlen=UbloxGps.MAX_NMEA_LINES)
 
         self.worker_exception_buffer = collections.deque(maxlen=UbloxGps.MAX_ERRORS)
-        self.pckt_scl = {
-            u'lon' : (10**-7),
-            u'lat' :  (10**-7),
-            u'headMot' :  (10**-5),
-            u'headAcc' :  (10**-5),
-
-            u'pDOP' :  0.01,
-            u'gDOP' : 0.01,
-            u'tDOP' : 0.01,
-            u'vDOP' : 0.01,
-            u'hDOP' : 0.01,
-            u'nDOP' : 0.01,
-            u'eDOP' : 0.01,
-
-            u'headVeh' : (10**-5),
-            u'magDec' : (10**-2),
-            u'magAcc' : (10**-2),
-
-            u'lonHp' : (10**-9),
-            u'latHp' : (10**-9),
-            u'heightHp' : 0.1,
-            u'hMSLHp' : 0.1,
-            u'hAcc' : 0.1,
-            u'vAcc' : 0.1,
-
-            u'errEllipseOrient': (10**-2),
-
-            u'ecefX' : 0.1,
-            u'ecefY' : 0.1,
-            u'ecefZ' : 0.1,
-            u'pAcc' : 0.1,
-
-            u'prRes' : 0.1,
-
-            u'cAcc' : (10**-5),
-            u'heading' : (10**-5),
-
-            u'relPosHeading' : (10**-5),
-            u'relPosHPN' : 0.1,
-            u'relPosHPE' : 0.1,
-            u'relPosHPD' : 0.1,
-            u'relPosHPLength' : 0.1,
-            u'accN' : 0.1,
-            u'accE' : 0.1,
-            u'accD' : 0.1,
-            u'accLength' : 0.1,
-            u'accPitch' : (10**-5),
-            u'accHeading' : (10**-5),
-
-            u'roll' : (10**-5),
-            u'pitch' : (10**-5),
-        }
-
-        #packet storage
+        # (field index, scale) pairs keyed by packet type, see scale_packet()
+        self._scale_cache = {}
+
+        #packet storage keyed by (class id, message id)
         self.packets = {}
+        # time.monotonic() each stored packet arrived at, same keys as packets
+        self._packet_time = {}
+        # last scaled NAV-PVT and when it was received, shared by geo_coords() and date_time()
+        self._last_pvt = (None, 0.0)
         # Class message values
         self.cls_ms = {}
+        # (class id, message id) keyed by (class name, message name)
+        self._id_of = {}
         #class message list for auto-update
         self.cls_ms_auto = {}
 
@@ -162,91 +343,130 @@ class UbloxGps(object):
         for (k,v) in vars(sp).items():
             if isinstance(v, core.Cls):
                 tmp_all_cls.append(v)
-                self.packets[v.name] = {}
                 self.cls_ms_auto[v.name] = []
                 self.cls_ms[v.name] = (v.id_, {})
 
                 for (mk, mv) in v._messages.items():
                     self.cls_ms[v.name][1][mv.name] = mk
+                    self._id_of[(v.name, mv.name)] = (v.id_, mk)
 
         self.parse_tool = core.Parser(tmp_all_cls)
 
+        # signalled by the reader thread when a packet is stored or an NMEA line arrives
+        self._pkt_cv = threading.Condition()
+        self._nmea_cv = threading.Condition()
+
         self.stopping = False
 
-        self.thread = threading.Thread(target=self.run_packet_reader, args=())
+        if backend == 'thread':
+            self._process = None
+            self.thread = threading.Thread(target=self.run_packet_reader, args=())
+        elif backend == 'process':
+            if isinstance(self.hard_port, sfeSpiWrapper.sfeSpiWrapper):
+                raise ValueError("The process backend only supports serial ports")
+
+            # The reader process opens the port again by name with the same settings,
+            # this one is only written to.
+            port_spec = (self.hard_port.port, self.hard_port.get_settings())
+            self._packet_queue = multiprocessing.Queue()
+            self._nmea_queue = multiprocessing.Queue()
+            self._stop_event = multiprocessing.Event()
+            self._process = multiprocessing.Process(target=_reader_main,
+                args=(port_spec, self._packet_queue, self._nmea_queue, self._stop_event))
+            self._process.daemon = True
+            self._process.start()
+
+            self.thread = threading.Thread(target=self.run_queue_reader, args=())
+            self._nmea_thread = threading.Thread(target=self.run_nmea_queue_reader, args=())
+            self._nmea_thread.daemon = True
+            self._nmea_thread.start()
+        else:
+            raise ValueError("Unknown backend {}".format(backend))
+
         self.thread.daemon = True
         self.thread.start()
 
 
     def set_packet(self, cls_name, msg_name, payload):
-        u"""
+        """
         Creates a new packet with the given class and message name. 
         """
-        if (payload is None):
-            if msg_name in self.packets[cls_name]:
-                del self.packets[cls_name][msg_name]
-        else:
-            self.packets[cls_name][msg_name] = payload
+        self._set_packet(self._id_of[(cls_name, msg_name)], payload)
+
+    def _set_packet(self, key, payload):
+        with self._pkt_cv:
+            if (payload is None):
+                self.packets.pop(key, None)
+                self._packet_time.pop(key, None)
+            else:
+                self.packets[key] = payload
+                self._packet_time[key] = time.monotonic()
+                self._pkt_cv.notify_all()
 
     def wait_packet(self, cls_name, msg_name, wait_time):
-        u"""
+        """
         Parses messages for the given class and message as long as the given time is not 
         exceeeded.
         :return: ublox message
         :rtype: namedtuple
         """
-        if wait_time < 0 or wait_time is None:
-            wait_time = 0
-
-        orig_tm = time.time() # not in 2.7 time.monotonic()
-
-        while (msg_name not in self.packets[cls_name]):
-            time.sleep(0.05)
+        key = self._id_of[(cls_name, msg_name)]
+        deadline = time.monotonic() + max(wait_time or 0, 0) / 1000.0
 
-            if ((time.time()  - orig_tm) >= wait_time / 1000.0 ): # was time.monotonic()
-                break
-
-        return self.packets[cls_name][msg_name] if msg_name in self.packets[cls_name] else None
-
-    def run_packet_reader(self):
-        c2 = str()
-
-        while True:
-            try:
-                if (self.stopping):
+        with self._pkt_cv:
+            while key not in self.packets:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
                     break
+                self._pkt_cv.wait(remaining)
 
-                c2 = c2 + self.hard_port.read(1)
-                c2 = c2[-len(core.Parser.PREFIX):] # keep just 2 bytes, dump the rest
-
-                if (c2[-1:] == '$'):
-                    nmea_data = core.Parser._read_until(self.hard_port, '\x0d\x0a')
-                    try:
-                        self.nmea_line_buffer.append(u'$' + nmea_data.decode(u'utf-8').rstrip(u' \r\n'))
-                    except:
-                        pass #we just ignore bad messages, we don't ignore communication issues though
+            return self.packets.get(key)
 
-                    c2 = ''
-                elif (c2 == core.Parser.PREFIX):
-                    cls_name, msg_name, payload = self.parse_tool.receive_from(self.hard_port, True, True)
+    def run_packet_reader(self):
+        _read_port(self.hard_port, self.parse_tool, self._frame_received, self._nmea_received,
+                   self.worker_exception_buffer.append, lambda: self.stopping)
 
-                    if not(cls_name is None or msg_name is None or payload is None):
-                        self.set_packet(cls_name, msg_name, payload)
+    def run_queue_reader(self):
+        """
+        Stores the frames sent by the reader process until the None sentinel.
+        """
+        for item in iter(self._packet_queue.get, None):
+            if isinstance(item, BaseException):
+                self.worker_exception_buffer.append(item)
+                continue
 
-                if (self.stopping):
-                    break
+            try:
+                payload = self.parse_tool.parse_frame(item)[2]
+            except Exception as e:
+                self.worker_exception_buffer.append(e.with_traceback(None))
+            else:
+                self._set_packet((item[0], item[1]), payload)
 
-                time.sleep(0.01)
+    def run_nmea_queue_reader(self):
+        """
+        Buffers the NMEA lines sent by the reader process until the None sentinel.
+        """
+        for nmea_line in iter(self._nmea_queue.get, None):
+            self._nmea_received(nmea_line)
 
-            except: # catch *all* exceptions
-                self.worker_exception_buffer.append(sys.exc_info())
-                # print(sys.exc_info())
+    def _frame_received(self, ubx_cls, msg, frame):
+        msg_name, payload = msg.parse(frame[4:])
+        self._set_packet((ubx_cls.id_, msg.id_), payload)
 
-                if (self.stopping):
-                    break
+    def _nmea_received(self, nmea_line):
+        with self._nmea_cv:
+            self.nmea_line_buffer.append(nmea_line)
+            self._nmea_cv.notify_all()
 
     def stop(self):
         self.stopping = True
+        if self._process is not None:
+            self._stop_event.set()
+            self._process.join()
+            # queued after anything the reader process sent, ends the queue readers
+            self._packet_queue.put(None)
+            self._nmea_queue.put(None)
+            self._nmea_thread.join()
         self.thread.join()
 
     def __enter__(self):
@@ -256,7 +476,7 @@ class UbloxGps(object):
         self.stop()
 
     def send_message(self, cls_name, msg_name, ubx_payload = None):
-        u"""
+        """
         Sends a ublox message to the ublox module.
 
         :param cls_name:   The ublox class with which to send or receive the
@@ -264,48 +484,30 @@ class UbloxGps(object):
         :param msg_name:      The message name under the ublox class with which
                             to send or receive the message to/from.
         :param ubx_payload: The payload to send to the class/id specified. If
-                            none is given than a "poll request" is
-                            initiated.
+                            none or an empty payload is given than a "poll
+                            request" is initiated.
         :return: True on completion
         :rtype: boolean
         """
 
-        ubx_class_id = self.cls_ms[cls_name][0] #convert names to ids
-        ubx_id = self.cls_ms[cls_name][1][msg_name]
+        ubx_class_id, ubx_id = self._id_of[(cls_name, msg_name)] #convert names to ids
 
         SYNC_CHAR1 = 0xB5
         SYNC_CHAR2 = 0x62
 
-        if ubx_payload == '\x00':
-            ubx_payload = None
-
-        if ubx_payload is None:
-            payload_length = 0
-        elif isinstance(ubx_payload, list):
-            ubx_payload = str(ubx_payload)
-            payload_length = len(ubx_payload)
-        elif not(isinstance(ubx_payload, str)):
-            ubx_payload = str([ubx_payload])
-            payload_length = len(ubx_payload)
-        else:
-            payload_length = len(ubx_payload)
-
-
-        message = str((SYNC_CHAR1, SYNC_CHAR2,
-                      ubx_class_id, ubx_id, (payload_length & 0xFF),
-                      (payload_length >> 8)))
+        payload = _payload_bytes(ubx_payload)
 
-        if payload_length > 0:
-             message = message + ubx_payload
+        message = _UBX_HDR.pack(SYNC_CHAR1, SYNC_CHAR2, ubx_class_id, ubx_id, len(payload)) + payload
 
-        checksum = core.Parser._generate_fletcher_checksum(message[2:])
+        # the checksum covers everything after the sync chars
+        checksum = core.Parser._generate_fletcher_checksum(memoryview(message)[2:])
 
         self.hard_port.write(message + checksum)
 
         return True
 
     def request_standard_packet(self, cls_name, msg_name, ubx_payload = None, wait_time = 2500, rethrow_thread_exception = True):
-        u"""
+        """
         Sends a poll request for the ubx_class_id class with the ubx_id Message ID and
         parses ublox messages for the response. The payload is extracted from
         the response which is then scaled and passed to the user.
@@ -313,52 +515,65 @@ class UbloxGps(object):
         :rtype: namedtuple
         """
 
-        if ubx_payload == '\x00':
-            ubx_payload = None
+        # None and negative times mean no wait, as in wait_packet()
+        wait_ms = max(wait_time or 0, 0)
+        orig_packet = None
+
+        if msg_name in self.cls_ms_auto[cls_name] and (ubx_payload is None or ubx_payload == _POLL):
+            # An auto message that arrived within the last half of wait_time is returned
+            # straight away, an older one is polled for like any other message.
+            key = self._id_of[(cls_name, msg_name)]
+            with self._pkt_cv:
+                if key in self.packets and (time.monotonic() - self._packet_time[key]) * 1000 < wait_ms / 2:
+                    orig_packet = self.packets[key]
 
-        if not(msg_name in self.cls_ms_auto[cls_name] and ubx_payload is None):
+        if orig_packet is None:
             self.set_packet(cls_name, msg_name, None)
             self.send_message(cls_name, msg_name, ubx_payload)
-
-        orig_packet = self.wait_packet(cls_name, msg_name, wait_time)
+            orig_packet = self.wait_packet(cls_name, msg_name, wait_ms)
 
         if len(self.worker_exception_buffer) > 0:
-            err = self.worker_exception_buffer.popleft()
-            # raise err[1].with_traceback(err[2])
-            raise err[1]
+            raise self.worker_exception_buffer.popleft()
 
         return self.scale_packet(orig_packet) if (orig_packet is not None) else None
 
     def scale_packet(self, packet):
-        u"""
+        """
         Scales the given packet to the unit specified in the interface manual.
         :return: ublox payload
         :rtype: packet
         """
-        dict_packet = packet._asdict()
-        isdirty = False
-        for (k,v) in dict_packet.items():
-            if k in self.pckt_scl:
-                isdirty = True
-                dict_packet[k] = self.pckt_scl[k] * v
+        packet_type = type(packet)
+        scales = self._scale_cache.get(packet_type)
+        if scales is None:
+            scales = [(i, _PCKT_SCL[k]) for (i, k) in enumerate(packet._fields) if k in _PCKT_SCL_KEYS]
+            self._scale_cache[packet_type] = scales
+
+        if not scales:
+            return packet #we only need to reallocate and rebuild packet if it was changed
 
-        return type(packet)(**dict_packet) if isdirty else packet #we only need to reallocate and rebuild packet if it was changed
+        values = list(packet)
+        for (i, scale) in scales:
+            values[i] = scale * values[i]
+
+        return packet_type._make(values)
 
 
     def stream_nmea(self, wait_for_nmea = True):
-        u"""
+        """
         Checks NMEA buffer for new messages and passes them back to the user 
         when detected. 
         :return: nmea message
         :rtype: string
         """
-        while wait_for_nmea and len(self.nmea_line_buffer) == 0:
-            time.sleep(0.05)
+        with self._nmea_cv:
+            if wait_for_nmea:
+                self._nmea_cv.wait_for(lambda: len(self.nmea_line_buffer) > 0)
 
-        return self.nmea_line_buffer.popleft() if len(self.nmea_line_buffer) > 0 else None
+            return self.nmea_line_buffer.popleft() if len(self.nmea_line_buffer) > 0 else None
 
     def ubx_get_val(self, key_id, layer = 0, wait_time = 2500):
-        u"""
+        """
         This function takes the given key id and breakes it into individual bytes
         which are then cocantenated together. This payload is then sent along
         with the CFG Class and VALGET Message ID to send_message(). Ublox
@@ -372,50 +587,38 @@ class UbloxGps(object):
         if layer != 7:
             layer = 0
 
-        payloadCfg = [0,layer,0,0,
-            (key_id) & 255,
-            (key_id >> 8) & 255,
-            (key_id >> 16) & 255,
-            (key_id >> 24) & 255
-        ]
+        payloadCfg = _CFG_VAL_HDR.pack(0, layer, 0, 0, key_id)
 
-        return self.request_standard_packet(u'CFG', u'VALGET', str(payloadCfg), wait_time = wait_time) #we return result immediately, hope get_val request won't overlap
+        return self.request_standard_packet('CFG', 'VALGET', payloadCfg, wait_time = wait_time) #we return result immediately, hope get_val request won't overlap
 
     def ubx_set_val(self, key_id, ubx_payload, layer = 7, wait_time = 2500):
-        u"""
+        """
         This function takes the given key id and breakes it into individual bytes
         which are then cocantenated together. This payload is then sent along
         with the CFG Class and VALSET Message ID to send_message(). Ublox
         Messages are then parsed for the requested values or a NAK signifying a
         problem.
+
+        :param ubx_payload: The value to set. An int or float is packed to
+                            the value size encoded in the key id (bits
+                            28-30), a negative int as signed. bytes, a
+                            bytearray or a list of byte values are sent as
+                            they are, already in little-endian order.
         :return: None
         :rtype: namedtuple
         """
 
-
-        if ubx_payload is None:
-            return
-        elif isinstance(ubx_payload, list):
-            ubx_payload = str(ubx_payload)
-        elif not(isinstance(ubx_payload, str)):
-            ubx_payload = str([ubx_payload])
+        ubx_payload = _cfg_val_bytes(key_id, ubx_payload)
 
         if len(ubx_payload) == 0:
             return
 
+        payloadCfg = _CFG_VAL_HDR.pack(0, layer, 0, 0, key_id)
 
-        payloadCfg = [0,layer,0,0,
-            (key_id) & 255,
-            (key_id >> 8) & 255,
-            (key_id >> 16) & 255,
-            (key_id >> 24) & 255
-        ]
-
-        self.request_standard_packet(u'CFG', u'VALSET', str(payloadCfg) + ubx_payload, wait_time = wait_time)
+        self.request_standard_packet('CFG', 'VALSET', payloadCfg + ubx_payload, wait_time = wait_time)
 
     def set_auto_msg(self, cls_name, msg_name, freq, wait_time = 2500):
-        ubx_class_id = self.cls_ms[cls_name][0] #convert names to ids
-        ubx_id = self.cls_ms[cls_name][1][msg_name]
+        ubx_class_id, ubx_id = self._id_of[(cls_name, msg_name)] #convert names to ids
 
         if freq is None:
             freq = 0
@@ -432,234 +635,62 @@ class UbloxGps(object):
 
         payloadCfg = [ubx_class_id, ubx_id, freq]
 
-        self.request_standard_packet(u'CFG', u'MSG', payloadCfg, wait_time = wait_time)
-
-    def geo_coords(self, wait_time = 2500):
-        u"""
--       Sends a poll request for NAV class and the PVT Message 
-+       The response is then passed on to the user.
+        self.request_standard_packet('CFG', 'MSG', payloadCfg, wait_time = wait_time)
 
-        :return: ublox payload
-        :rtype: namedtuple
+    def _get_pvt(self, wait_time, max_age_ms = 100):
         """
-        return self.request_standard_packet(u'NAV', u'PVT', wait_time = wait_time)
-
-    def get_DOP(self, wait_time = 2500):
-        u"""
--       Sends a poll request for NAV class and the DOP Message 
-+       The response is then passed on to the user.
-
-        :return: ublox payload
-        :rtype: namedtuple
+        Returns the last NAV-PVT packet if it is less than max_age_ms old,
+        otherwise polls for a new one.
         """
-        return self.request_standard_packet(u'NAV', u'DOP', wait_time = wait_time)
+        pvt, pvt_time = self._last_pvt
+        if pvt is not None and (time.monotonic() - pvt_time) * 1000 < max_age_ms:
+            return pvt
 
-    def geo_cov(self, wait_time = 2500):
-        u"""
--       Sends a poll request for NAV class and the COV Message 
-+       The response is then passed on to the user.
+        pvt = self.request_standard_packet('NAV', 'PVT', wait_time = wait_time)
+        if pvt is not None:
+            self._last_pvt = (pvt, time.monotonic())
+        return pvt
 
-        :return: ublox payload
-        :rtype: namedtuple
+    def geo_coords(self, wait_time = 2500):
         """
-        return self.request_standard_packet(u'NAV', u'COV', wait_time = wait_time)
-
-    def hp_geo_coords(self, wait_time = 2500):
-        u"""
--       Sends a poll request for NAV class and the HPPOSLLH Message 
-+       The response is then passed on to the user.
+        Sends a poll request for the NAV class and the PVT Message.
+        The response is then passed on to the user.
 
         :return: ublox payload
         :rtype: namedtuple
         """
-        return self.request_standard_packet(u'NAV', u'HPPOSLLH', wait_time = wait_time)
+        return self._get_pvt(wait_time)
 
     def date_time(self, wait_time = 2500):
-        u"""
--       Sends a poll request for NAV class and the HPPOSLLH Message 
-+       The response is then passed on to the user.
-
-        :return: ublox payload
-        :rtype: namedtuple
         """
-        return self.request_standard_packet(u'NAV', u'PVT', wait_time = wait_time)
-
-    def satellites(self, wait_time = 2500):
-        u"""
--       Sends a poll request for NAV class and the SAT Message 
-+       The response is then passed on to the user.
-
-        :return: ublox payload
-        :rtype: namedtuple
-        """
-        return self.request_standard_packet(u'NAV', u'SAT', wait_time = wait_time)
-
-    def veh_attitude(self, wait_time = 2500):
-        u"""
--       Sends a poll request for NAV class and the ATT Message 
-+       The response is then passed on to the user.
-
-        :return: ublox payload
-        :rtype: namedtuple
-        """
-        return self.request_standard_packet(u'NAV', u'ATT', wait_time = wait_time)
-
-    def imu_alignment(self, wait_time = 2500):
-        u"""
--       Sends a poll request for ESF class and the ALG Message 
-+       The response is then passed on to the user.
-
-        :return: ublox payload
-        :rtype: namedtuple
-        """
-        return self.request_standard_packet(u'ESF', u'ALG', wait_time = wait_time)
-
-    def vehicle_dynamics(self, wait_time = 2500):
-        u"""
--       Sends a poll request for ESF class and the INS Message 
-+       The response is then passed on to the user.
-
-        :return: ublox payload
-        :rtype: namedtuple
-        """
-        return self.request_standard_packet(u'ESF', u'INS', wait_time = wait_time)
-
-    def esf_measures(self, wait_time = 2500):
-        u"""
--       Sends a poll request for ESF class and the MEAS Message 
-+       The response is then passed on to the user.
-
-        :return: ublox payload
-        :rtype: namedtuple
-        """
-        return self.request_standard_packet(u'ESF', u'MEAS', wait_time = wait_time)
-
-    def esf_raw_measures(self, wait_time = 2500):
-        u"""
--       Sends a poll request for ESF class and the RAW Message 
-+       The response is then passed on to the user.
-
-        :return: ublox payload
-        :rtype: namedtuple
-        """
-        return self.request_standard_packet(u'ESF', u'RAW', wait_time = wait_time)
-
-    def reset_imu_align(self, wait_time = 2500):
-        u"""
--       Sends a poll request for ESF class and the RESETALG Message 
-+       The response is then passed on to the user.
-
-        :return: ublox payload
-        :rtype: namedtuple
-        """
-        return self.request_standard_packet(u'ESF', u'RESETALG', wait_time = wait_time)
-
-    def esf_status(self, wait_time = 2500):
-        u"""
--       Sends a poll request for ESF class and the RESETALG Message 
-+       The response is then passed on to the user.
-
-        :return: ublox payload
-        :rtype: namedtuple
-        """
-        return self.request_standard_packet(u'ESF', u'STATUS', wait_time = wait_time)
-
-    def port_settings(self, wait_time = 2500):
-        u"""
--       Sends a poll request for ESF class and the COMMS Message 
-+       The response is then passed on to the user.
-
-        :return: ublox payload
-        :rtype: namedtuple
-        """
-        return self.request_standard_packet(u'MON', u'COMMS', wait_time = wait_time)
-
-    def module_gnss_support(self, wait_time = 2500):
-        u"""
--       Sends a poll request for MON class and the GNSS Message 
-+       The response is then passed on to the user.
-
-        :return: ublox payload
-        :rtype: namedtuple
-        """
-        return self.request_standard_packet(u'MON', u'GNSS', wait_time = wait_time)
-
-    def pin_settings(self, wait_time = 2500):
-        u"""
--       Sends a poll request for MON class and the HW2 Message 
-+       The response is then passed on to the user.
-
-        :return: ublox payload
-        :rtype: namedtuple
-        """
-        return self.request_standard_packet(u'MON', u'HW3', wait_time = wait_time)
-
-    def installed_patches(self, wait_time = 2500):
-        u"""
--       Sends a poll request for MON class and the PATCH Message 
-+       The response is then passed on to the user.
-
-        :return: ublox payload
-        :rtype: namedtuple
-        """
-        return self.request_standard_packet(u'MON', u'PATCH', wait_time = wait_time) #changed from HW3 to PATCH
-
-    def prod_test_pio(self, wait_time = 2500):
-        u"""
--       Sends a poll request for MON class and the PIO Message 
-+       The response is then passed on to the user.
-
-        :return: ublox payload
-        :rtype: namedtuple
-        """
-        return self.request_standard_packet(u'MON', u'PIO', wait_time = wait_time)
-
-    def prod_test_monitor(self, wait_time = 2500):
-        u"""
--       Sends a poll request for MON class and the PT2 Message 
-+       The response is then passed on to the user.
-
-        :return: ublox payload
-        :rtype: namedtuple
-        """
-        return self.request_standard_packet(u'MON', u'PT2', wait_time = wait_time)
-
-    def rf_ant_status(self, wait_time = 2500):
-        u"""
--       Sends a poll request for MON class and the RF Message 
-+       The response is then passed on to the user.
-
-        :return: ublox payload
-        :rtype: namedtuple
-        """
-        return self.request_standard_packet(u'MON', u'RF', wait_time = wait_time)
-
-    def module_wake_state(self, wait_time = 2500): #No response on F9P
-        u"""
--       Sends a poll request for MON class and the RXR Message 
-+       The response is then passed on to the user.
-
-        :return: ublox payload
-        :rtype: namedtuple
-        """
-        return self.request_standard_packet(u'MON', u'RXR', wait_time = wait_time)
-
-    def sensor_production_test(self, wait_time = 2500):#No response on F9P
-        u"""
--       Sends a poll request for MON class and the SPT Message 
-+       The response is then passed on to the user.
-
-        :return: ublox payload
-        :rtype: namedtuple
-        """
-        return self.request_standard_packet(u'MON', u'SPT', wait_time = wait_time)
-
-    def module_software_version(self, wait_time = 2500):
-        u"""
--       Sends a poll request for MON class and the VER Message 
-+       The response is then passed on to the user.
+        Sends a poll request for the NAV class and the PVT Message.
+        The response is then passed on to the user.
 
         :return: ublox payload
         :rtype: namedtuple
         """
-        return self.request_standard_packet(u'MON', u'VER', wait_time = wait_time)
+        return self._get_pvt(wait_time)
+
+    # methods that poll for a single message, geo_coords() and date_time() are
+    # written out above as they share a cached NAV-PVT
+    get_DOP = _make_poll('get_DOP', 'NAV', 'DOP')
+    geo_cov = _make_poll('geo_cov', 'NAV', 'COV')
+    hp_geo_coords = _make_poll('hp_geo_coords', 'NAV', 'HPPOSLLH')
+    satellites = _make_poll('satellites', 'NAV', 'SAT')
+    veh_attitude = _make_poll('veh_attitude', 'NAV', 'ATT')
+    imu_alignment = _make_poll('imu_alignment', 'ESF', 'ALG')
+    vehicle_dynamics = _make_poll('vehicle_dynamics', 'ESF', 'INS')
+    esf_measures = _make_poll('esf_measures', 'ESF', 'MEAS')
+    esf_raw_measures = _make_poll('esf_raw_measures', 'ESF', 'RAW')
+    reset_imu_align = _make_poll('reset_imu_align', 'ESF', 'RESETALG')
+    esf_status = _make_poll('esf_status', 'ESF', 'STATUS')
+    port_settings = _make_poll('port_settings', 'MON', 'COMMS')
+    module_gnss_support = _make_poll('module_gnss_support', 'MON', 'GNSS')
+    pin_settings = _make_poll('pin_settings', 'MON', 'HW3')
+    installed_patches = _make_poll('installed_patches', 'MON', 'PATCH')
+    prod_test_pio = _make_poll('prod_test_pio', 'MON', 'PIO')
+    prod_test_monitor = _make_poll('prod_test_monitor', 'MON', 'PT2')
+    rf_ant_status = _make_poll('rf_ant_status', 'MON', 'RF')
+    module_wake_state = _make_poll('module_wake_state', 'MON', 'RXR') #No response on F9P
+    sensor_production_test = _make_poll('sensor_production_test', 'MON', 'SPT') #No response on F9P
+    module_software_version = _make_poll('module_software_version', 'MON', 'VER')